@@ -1,6 +1,7 @@
 import argparse
 import base64
 import copy
+import heapq
 import itertools
 import json
 import multiprocessing
@@ -10,7 +11,8 @@ import sys
 import threading
 import time
 import uuid
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import ExitStack
 from typing import (
     Optional,
@@ -315,6 +317,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         super().__init__()
         self._version = '1'  #: YAML version number, this will be later overridden if YAML config says the other way
         self._pod_nodes = OrderedDict()  # type: Dict[str, Pod]
+        self._structure_fingerprint = None  # type: Optional[int]
+        self._graph_representation_cache = None  # type: Optional[Dict[str, List[str]]]
+        self._pod_addresses_cache = None  # type: Optional[Dict[str, List[str]]]
         self._inspect_pods = {}  # type: Dict[str, str]
         self._endpoints_mapping = {}  # type: Dict[str, Dict]
         self._build_level = FlowBuildLevel.EMPTY
@@ -439,13 +444,23 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         args.pods_addresses = json.dumps(pod_addresses)
         self._pod_nodes[GATEWAY_NAME] = Pod(args, needs)
 
+    def _invalidate_topology_caches(self):
+        """Drop every cached view of the topology, called whenever the Pod set
+        or their needs change."""
+        self._structure_fingerprint = None
+        self._graph_representation_cache = None
+        self._pod_addresses_cache = None
+
     def _get_pod_addresses(self) -> Dict[str, List[str]]:
+        if self._pod_addresses_cache is not None:
+            return self._pod_addresses_cache
         graph_dict = {}
         for node, v in self._pod_nodes.items():
             if node == 'gateway':
                 continue
             graph_dict[node] = [f'{v.host}:{v.head_port_in}']
 
+        self._pod_addresses_cache = graph_dict
         return graph_dict
 
     def _get_k8s_pod_addresses(self, k8s_namespace: str) -> Dict[str, List[str]]:
@@ -464,6 +479,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         return graph_dict
 
     def _get_graph_representation(self) -> Dict[str, List[str]]:
+        if self._graph_representation_cache is not None:
+            return self._graph_representation_cache
+
         def _add_node(graph, n):
             # in the graph we need to distinguish between start and end gateway, although they are the same pod
             if n == 'gateway':
@@ -486,6 +504,7 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         if last_pod != 'gateway':
             graph_dict[last_pod].append('end-gateway')
 
+        self._graph_representation_cache = graph_dict
         return graph_dict
 
     @allowed_levels([FlowBuildLevel.EMPTY])
@@ -765,6 +784,7 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
             args.port_in = port_in
 
         op_flow._pod_nodes[pod_name] = Pod(args, needs)
+        op_flow._invalidate_topology_caches()
 
         op_flow.last_pod = pod_name
 
@@ -905,6 +925,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         """
 
         op_flow = copy.deepcopy(self) if copy_flow else self
+        # a previous enter/exit cycle may have mutated the Pod set behind the
+        # cached views
+        op_flow._invalidate_topology_caches()
 
         if op_flow.args.inspect == FlowInspectType.COLLECT:
             op_flow.gather_inspect(copy_flow=False)
@@ -947,6 +970,10 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
             else:
                 pod.needs = set(reverse_inspect_map.get(ep, ep) for ep in pod.needs)
 
+        # the gateway insertion, the inspect filtering and the needs rewrites
+        # above all changed the topology
+        op_flow._invalidate_topology_caches()
+
         hanging_pods = _hanging_pods(op_flow)
         if hanging_pods:
             op_flow.logger.warning(
@@ -1019,9 +1046,7 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
             for k, v in self.args.env.items():
                 os.environ[k] = str(v)
 
-        for k, v in self:
-            if not getattr(v.args, 'external', False):
-                self.enter_context(v)
+        self._start_pods()
 
         self._wait_until_all_ready()
 
@@ -1029,6 +1054,91 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
 
         return self
 
+    def _start_pods(self):
+        """Start all non-external Pods, walking the Flow DAG so that independent
+        Pods start concurrently while a Pod only starts once all the Pods it
+        needs are started."""
+        pods_to_start = {
+            k: v for k, v in self if not getattr(v.args, 'external', False)
+        }
+        if not pods_to_start:
+            return
+
+        dependents = defaultdict(list)
+        predecessors_of = {}
+        num_waiting = {}
+        for name, pod in pods_to_start.items():
+            # the gateway is both the source and the sink of the data path, as
+            # a `needs` entry it would turn the DAG into a cycle, so only real
+            # inter-pod edges order the startup and the gateway goes last
+            predecessors = [
+                n
+                for n in pod.needs
+                if n in pods_to_start and n != name and n != GATEWAY_NAME
+            ]
+            predecessors_of[name] = predecessors
+            num_waiting[name] = len(predecessors)
+            for predecessor in predecessors:
+                dependents[predecessor].append(name)
+
+        # two topological passes give the longest path running through every
+        # Pod; when more Pods are ready than there are workers, the ones on the
+        # longer paths start first so their dependents unlock sooner
+        topo_order = []
+        indegree = dict(num_waiting)
+        stack = [name for name, degree in indegree.items() if degree == 0]
+        while stack:
+            name = stack.pop()
+            topo_order.append(name)
+            for dependent in dependents[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    stack.append(dependent)
+        top_level = {}
+        for name in topo_order:
+            top_level[name] = 1 + max(
+                (top_level[predecessor] for predecessor in predecessors_of[name]),
+                default=0,
+            )
+        bottom_level = {}
+        for name in reversed(topo_order):
+            bottom_level[name] = 1 + max(
+                (bottom_level[dependent] for dependent in dependents[name]),
+                default=0,
+            )
+
+        submit_order = itertools.count()
+
+        def _push_ready(heap, name):
+            priority = -(top_level[name] + bottom_level[name])
+            heapq.heappush(heap, (priority, next(submit_order), name))
+
+        ready = []
+        for name, degree in num_waiting.items():
+            if degree == 0:
+                _push_ready(ready, name)
+        num_workers = min(len(pods_to_start), (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            pending = {}
+            while ready:
+                _, _, name = heapq.heappop(ready)
+                pending[executor.submit(self.enter_context, pods_to_start[name])] = name
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = pending.pop(future)
+                    # surface startup failures right away
+                    future.result()
+                    for dependent in dependents[name]:
+                        num_waiting[dependent] -= 1
+                        if num_waiting[dependent] == 0:
+                            _push_ready(ready, dependent)
+                while ready:
+                    _, _, name = heapq.heappop(ready)
+                    pending[
+                        executor.submit(self.enter_context, pods_to_start[name])
+                    ] = name
+
     def _wait_until_all_ready(self):
         results = {}
         threads = []
@@ -1131,6 +1241,27 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         .. # noqa: DAR201"""
         return sum(v.num_peas for v in self._pod_nodes.values())
 
+    @property
+    def _fingerprint(self) -> int:
+        """Get a hash of the built topology of this Flow.
+
+        The fingerprint captures exactly what the pod-by-pod comparison looks
+        at, it is computed at most once per topology and invalidated whenever
+        a Pod is added.
+
+        .. # noqa: DAR201"""
+        if self._structure_fingerprint is None:
+            if self._build_level.value < FlowBuildLevel.GRAPH.value:
+                built = copy.deepcopy(self).build(copy_flow=False)
+            else:
+                built = self
+            self._structure_fingerprint = hash(
+                frozenset(
+                    (name, pod.num_peas) for name, pod in built._pod_nodes.items()
+                )
+            )
+        return self._structure_fingerprint
+
     def __eq__(self, other: 'Flow') -> bool:
         """
         Compare the topology of a Flow with another Flow.
@@ -1140,6 +1271,10 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :return: result of equality check
         """
 
+        # the cheap fingerprint compare settles everything but hash collisions
+        if self._fingerprint != other._fingerprint:
+            return False
+
         if self._build_level.value < FlowBuildLevel.GRAPH.value:
             op_flow = copy.deepcopy(self)
             a = op_flow.build()
@@ -786,7 +786,12 @@ class ArgNamespace:
         if taboo is None:
             taboo = set()
         non_defaults = {}
-        _defaults = vars(parser.parse_args([]))
+        # computing the defaults requires a full parse, cache them on the
+        # parser so repeated lookups against the same parser are a dict access
+        _defaults = getattr(parser, '_default_values', None)
+        if _defaults is None:
+            _defaults = vars(parser.parse_args([]))
+            parser._default_values = _defaults
         for k, v in vars(args).items():
             if k in _defaults and k not in taboo and _defaults[k] != v:
                 non_defaults[k] = v
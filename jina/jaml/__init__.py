@@ -1,5 +1,6 @@
 import copy
 import os
+import pickle
 import re
 import tempfile
 import warnings
@@ -11,7 +12,7 @@ from yaml.constructor import FullConstructor
 
 from .helper import JinaResolver, JinaLoader, parse_config_source, load_py_modules
 
-__all__ = ['JAML', 'JAMLCompatible']
+__all__ = ['JAML', 'JAMLCompatible', 'FileCache']
 
 from ..excepts import BadConfigSource
 from ..helper import expand_env_var
@@ -22,6 +23,70 @@ subvar_regex = re.compile(
 internal_var_regex = re.compile(r'{.+}|\$[a-zA-Z0-9_]*\b')
 
 
+class FileCache:
+    """A cache of parsed YAML files keyed by their modification time and size.
+
+    Repeated loads of the same unchanged file return a deep copy of the
+    already parsed dict instead of parsing the YAML text again. A changed
+    file invalidates its entry automatically because the fingerprint no
+    longer matches.
+
+    When ``JINA_PRECOMPILE_CONFIG`` is set in the environment, the parsed
+    dict is additionally pickled to a ``<path>.compiled`` snapshot next to
+    the YAML file, so later processes can skip the YAML parse entirely. A
+    snapshot older than its YAML file is ignored.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def get(self, path: str, fp: TextIO) -> Dict:
+        """Return the parsed no-tag YAML dict for ``path``, parsing ``fp`` only on a cache miss.
+
+        :param path: the file path used as the cache key and fingerprint source
+        :param fp: the opened stream of ``path``, only read when the cache misses
+        :return: a deep copy of the parsed dict, safe to mutate by the caller
+        """
+        try:
+            stat = os.stat(path)
+            fingerprint = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return JAML.load_no_tags(fp)
+        entry = self._cache.get(path)
+        if entry is None or entry[0] != fingerprint:
+            entry = (fingerprint, self._parse(path, fp))
+            self._cache[path] = entry
+        # the parsing pipeline mutates the dict in-place, hand out a copy so
+        # the cached entry stays pristine
+        return copy.deepcopy(entry[1])
+
+    @staticmethod
+    def _parse(path: str, fp: TextIO) -> Dict:
+        compiled_path = path + '.compiled'
+        # the snapshots are strictly opt-in: only read them back when the same
+        # switch that enables writing them is set, unpickling a stray
+        # `.compiled` neighbor of a config would run arbitrary code
+        if 'JINA_PRECOMPILE_CONFIG' in os.environ:
+            try:
+                if os.path.getmtime(compiled_path) >= os.path.getmtime(path):
+                    with open(compiled_path, 'rb') as compiled_fp:
+                        return pickle.load(compiled_fp)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+        parsed = JAML.load_no_tags(fp)
+        if 'JINA_PRECOMPILE_CONFIG' in os.environ:
+            # best effort, the config may well live in a read-only location
+            try:
+                with open(compiled_path, 'wb') as compiled_fp:
+                    pickle.dump(parsed, compiled_fp, pickle.HIGHEST_PROTOCOL)
+            except OSError:
+                pass
+        return parsed
+
+
+_yaml_file_cache = FileCache()
+
+
 class JAML:
     """A Jina YAML parser supports loading and dumping and substituting variables.
 
@@ -451,12 +516,17 @@ class JAMLCompatible(metaclass=JAMLCompatibleType):
 
         return get_parser(cls, version=data.get('version', None)).parse(cls, data)
 
-    def save_config(self, filename: Optional[str] = None):
+    def save_config(self, filename: Optional[Union[str, TextIO]] = None):
         """
-        Save the object's config into a YAML file.
+        Save the object's config into a YAML file or a writable stream.
 
-        :param filename: file path of the yaml file, if not given then :attr:`config_abspath` is used
+        :param filename: file path of the yaml file or a file-like object to write to,
+            if not given then :attr:`config_abspath` is used
         """
+        if filename is not None and hasattr(filename, 'write'):
+            # a writable stream, dump straight into it without touching disk
+            JAML.dump(self, filename)
+            return
         f = filename or getattr(self, 'config_abspath', None)
         if not f:
             f = tempfile.NamedTemporaryFile(
@@ -542,8 +612,12 @@ class JAMLCompatible(metaclass=JAMLCompatibleType):
             source, extra_search_paths=extra_search_paths, **kwargs
         )
         with stream as fp:
-            # first load yml with no tag
-            no_tag_yml = JAML.load_no_tags(fp)
+            # first load yml with no tag, going through the file cache when
+            # the source is an actual file on disk
+            if s_path:
+                no_tag_yml = _yaml_file_cache.get(s_path, fp)
+            else:
+                no_tag_yml = JAML.load_no_tags(fp)
             if no_tag_yml:
                 no_tag_yml.update(**kwargs)
 
@@ -84,20 +84,39 @@ class JinaResolver(Resolver):
     pass
 
 
-class JinaLoader(Reader, Scanner, Parser, Composer, JinaConstructor, JinaResolver):
-    """
-    The Jina loader which should be able to load YAML safely.
+try:
+    from yaml.cyaml import CParser
 
-    :param stream: the stream to load.
-    """
+    class JinaLoader(CParser, JinaConstructor, JinaResolver):
+        """
+        The Jina loader which should be able to load YAML safely.
+
+        Scanning, parsing and composing are delegated to libyaml.
+
+        :param stream: the stream to load.
+        """
+
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            JinaConstructor.__init__(self)
+            JinaResolver.__init__(self)
+
+except ImportError:
+
+    class JinaLoader(Reader, Scanner, Parser, Composer, JinaConstructor, JinaResolver):
+        """
+        The Jina loader which should be able to load YAML safely.
+
+        :param stream: the stream to load.
+        """
 
-    def __init__(self, stream):
-        Reader.__init__(self, stream)
-        Scanner.__init__(self)
-        Parser.__init__(self)
-        Composer.__init__(self)
-        JinaConstructor.__init__(self)
-        JinaResolver.__init__(self)
+        def __init__(self, stream):
+            Reader.__init__(self, stream)
+            Scanner.__init__(self)
+            Parser.__init__(self)
+            Composer.__init__(self)
+            JinaConstructor.__init__(self)
+            JinaResolver.__init__(self)
 
 
 # remove on|On|ON resolver
@@ -1,26 +1,50 @@
 import copy
+import functools
+import os
 from argparse import Namespace
 from typing import Dict, Union, List, Optional, Tuple
 
 from .... import __default_executor__, __version__
 from ....enums import PeaRoleType
+from ....helper import cached_property
 from .k8slib import kubernetes_deployment
 from ...networking import K8sGrpcConnectionPool
 from .. import BasePod
 
 
+def _copy_with_overrides(args: Namespace, **overrides) -> Namespace:
+    new_args = copy.copy(args)
+    vars(new_args).update(overrides)
+    return new_args
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pea_parser():
+    from ....parsers import set_pea_parser
+
+    return set_pea_parser()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_gateway_parser():
+    from ....parsers import set_gateway_parser
+
+    return set_gateway_parser()
+
+
+@functools.lru_cache(maxsize=1)
 def _get_base_executor_version():
     import requests
 
     try:
-        url = 'https://registry.hub.docker.com/v1/repositories/jinaai/jina/tags'
-        tags = requests.get(url).json()
-        name_set = {tag['name'] for tag in tags}
-        if __version__ in name_set:
+        url = f'https://registry.hub.docker.com/v2/jinaai/jina/manifests/{__version__}'
+        if requests.head(url, timeout=2).status_code == 200:
             return __version__
         else:
             return 'master'
-    except:
+    except requests.exceptions.RequestException:
+        # offline or unresolvable registry (e.g. DNS failure) falls back
+        # immediately instead of hanging config generation
         return 'master'
 
 
@@ -33,7 +57,6 @@ class K8sPodConfig:
         def __init__(
             self,
             name: str,
-            version: str,
             pea_type: PeaRoleType,
             jina_pod_name: str,
             shard_id: Optional[int],
@@ -45,7 +68,6 @@ class K8sPodConfig:
         ):
             self.name = name
             self.dns_name = kubernetes_deployment.to_dns_name(name)
-            self.version = version
             self.pea_type = pea_type
             self.jina_pod_name = jina_pod_name
             self.shard_id = shard_id
@@ -56,25 +78,45 @@ class K8sPodConfig:
             self.k8s_connection_pool = k8s_connection_pool
             self.k8s_pod_addresses = k8s_pod_addresses
 
-        def get_gateway_yamls(
-            self,
-        ) -> List[Dict]:
-            import os
+        @cached_property
+        def version(self) -> str:
+            """The version tag of the base jina image, resolved lazily on the
+            first yaml getter call instead of in ``__init__`` so building the
+            config objects does not touch the registry.
+
+            :return: the version tag to use for the base images
+            """
+            return _get_base_executor_version()
 
+        @cached_property
+        def _gateway_image_name(self) -> str:
             test_pip = os.getenv('JINA_K8S_USE_TEST_PIP') is not None
-            image_name = (
+            return (
                 'jinaai/jina:test-pip'
                 if test_pip
                 else f'jinaai/jina:{self.version}-py38-standard'
             )
+
+        @cached_property
+        def _base_executor_image_name(self) -> str:
+            test_pip = os.getenv('JINA_K8S_USE_TEST_PIP') is not None
+            return (
+                'jinaai/jina:test-pip'
+                if test_pip
+                else f'jinaai/jina:{self.version}-py38-perf'
+            )
+
+        def get_gateway_yamls(
+            self,
+        ) -> List[Dict]:
+            image_name = self._gateway_image_name
             cargs = copy.copy(self.deployment_args)
             cargs.pods_addresses = self.k8s_pod_addresses
             from ....helper import ArgNamespace
-            from ....parsers import set_gateway_parser
 
             non_defaults = ArgNamespace.get_non_defaults_args(
                 cargs,
-                set_gateway_parser(),
+                _get_gateway_parser(),
             )
             _args = ArgNamespace.kwargs2list(non_defaults)
             container_args = ['gateway'] + _args
@@ -85,7 +127,7 @@ class K8sPodConfig:
                 namespace=self.k8s_namespace,
                 image_name=image_name,
                 container_cmd='["jina"]',
-                container_args=f'{container_args}',
+                container_args=container_args,
                 replicas=1,
                 pull_policy='IfNotPresent',
                 jina_pod_name='gateway',
@@ -98,11 +140,10 @@ class K8sPodConfig:
         def _construct_runtime_container_args(cargs, uses_metas, uses_with, pea_type):
             import json
             from ....helper import ArgNamespace
-            from ....parsers import set_pea_parser
 
             non_defaults = ArgNamespace.get_non_defaults_args(
                 cargs,
-                set_pea_parser(),
+                _get_pea_parser(),
                 taboo={'uses_with', 'uses_metas', 'volumes'},
             )
             _args = ArgNamespace.kwargs2list(non_defaults)
@@ -117,14 +158,7 @@ class K8sPodConfig:
             return container_args
 
         def _get_image_name(self, uses: Optional[str]):
-            import os
-
-            test_pip = os.getenv('JINA_K8S_USE_TEST_PIP') is not None
-            image_name = (
-                'jinaai/jina:test-pip'
-                if test_pip
-                else f'jinaai/jina:{self.version}-py38-perf'
-            )
+            image_name = self._base_executor_image_name
 
             if uses is not None and uses != __default_executor__:
                 image_name = kubernetes_deployment.get_image_name(uses)
@@ -132,7 +166,9 @@ class K8sPodConfig:
             return image_name
 
         def _get_container_args(self, cargs, pea_type):
-            uses_metas = cargs.uses_metas or {}
+            # shard args are shallow copies of the same namespace, so do not
+            # write the shard id into a shared uses_metas dict
+            uses_metas = dict(cargs.uses_metas) if cargs.uses_metas else {}
             if self.shard_id is not None:
                 uses_metas['pea_id'] = self.shard_id
             uses_with = self.deployment_args.uses_with
@@ -161,30 +197,34 @@ class K8sPodConfig:
             container_args = self._get_container_args(cargs, pea_type=self.pea_type)
             container_args_uses_before = None
             if getattr(cargs, 'uses_before', False):
-                uses_before_cargs = copy.copy(cargs)
-                uses_before_cargs.uses = cargs.uses_before
-                uses_before_cargs.name = f'{self.common_args.name}/uses-before'
-                uses_before_cargs.port_in = K8sGrpcConnectionPool.K8S_PORT_USES_BEFORE
-                uses_before_cargs.uses_before_address = None
-                uses_before_cargs.uses_after_address = None
-                uses_before_cargs.connection_list = None
-                uses_before_cargs.runtime_cls = 'WorkerRuntime'
-                uses_before_cargs.pea_role = PeaRoleType.WORKER
+                uses_before_cargs = _copy_with_overrides(
+                    cargs,
+                    uses=cargs.uses_before,
+                    name=f'{self.common_args.name}/uses-before',
+                    port_in=K8sGrpcConnectionPool.K8S_PORT_USES_BEFORE,
+                    uses_before_address=None,
+                    uses_after_address=None,
+                    connection_list=None,
+                    runtime_cls='WorkerRuntime',
+                    pea_role=PeaRoleType.WORKER,
+                )
                 container_args_uses_before = self._get_container_args(
                     uses_before_cargs, PeaRoleType.WORKER
                 )
 
             container_args_uses_after = None
             if getattr(cargs, 'uses_after', False):
-                uses_after_cargs = copy.copy(cargs)
-                uses_after_cargs.uses = cargs.uses_after
-                uses_after_cargs.name = f'{self.common_args.name}/uses-after'
-                uses_after_cargs.port_in = K8sGrpcConnectionPool.K8S_PORT_USES_AFTER
-                uses_after_cargs.uses_before_address = None
-                uses_after_cargs.uses_after_address = None
-                uses_after_cargs.connection_list = None
-                uses_after_cargs.runtime_cls = 'WorkerRuntime'
-                uses_after_cargs.pea_role = PeaRoleType.WORKER
+                uses_after_cargs = _copy_with_overrides(
+                    cargs,
+                    uses=cargs.uses_after,
+                    name=f'{self.common_args.name}/uses-after',
+                    port_in=K8sGrpcConnectionPool.K8S_PORT_USES_AFTER,
+                    uses_before_address=None,
+                    uses_after_address=None,
+                    connection_list=None,
+                    runtime_cls='WorkerRuntime',
+                    pea_role=PeaRoleType.WORKER,
+                )
                 container_args_uses_after = self._get_container_args(
                     uses_after_cargs, PeaRoleType.WORKER
                 )
@@ -198,7 +238,7 @@ class K8sPodConfig:
                 container_cmd='["jina"]',
                 container_cmd_uses_before='["jina"]',
                 container_cmd_uses_after='["jina"]',
-                container_args=f'{container_args}',
+                container_args=container_args,
                 container_args_uses_before=container_args_uses_before,
                 container_args_uses_after=container_args_uses_after,
                 replicas=self.num_replicas,
@@ -235,7 +275,6 @@ class K8sPodConfig:
         if self.deployment_args['head_deployment'] is not None:
             self.head_deployment = self._K8sDeployment(
                 name=self.deployment_args['head_deployment'].name,
-                version=_get_base_executor_version(),
                 shard_id=None,
                 jina_pod_name=self.name,
                 common_args=self.args,
@@ -253,7 +292,6 @@ class K8sPodConfig:
             self.worker_deployments.append(
                 self._K8sDeployment(
                     name=name,
-                    version=_get_base_executor_version(),
                     shard_id=i,
                     common_args=self.args,
                     deployment_args=args,
@@ -288,12 +326,9 @@ class K8sPodConfig:
                 import json
 
                 connection_list = {}
+                dns_name = kubernetes_deployment.to_dns_name(self.name)
                 for i in range(shards):
-                    name = (
-                        f'{kubernetes_deployment.to_dns_name(self.name)}-{i}'
-                        if shards > 1
-                        else f'{kubernetes_deployment.to_dns_name(self.name)}'
-                    )
+                    name = f'{dns_name}-{i}' if shards > 1 else dns_name
                     connection_list[
                         str(i)
                     ] = f'{name}.{self.k8s_namespace}.svc:{K8sGrpcConnectionPool.K8S_PORT_IN}'
@@ -316,7 +351,7 @@ class K8sPodConfig:
             )
 
         for i in range(shards):
-            cargs = copy.deepcopy(args)
+            cargs = copy.copy(args)
             cargs.shard_id = i
             cargs.uses_before = None
             cargs.uses_after = None
@@ -350,10 +385,21 @@ class K8sPodConfig:
         else:
             deployments = [self.head_deployment]
             deployments.extend(self.worker_deployments)
+            if len(deployments) > 1:
+                # image resolution inside get_runtime_yamls may hit the Hub,
+                # generate the shard yamls concurrently to overlap the waits
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor() as executor:
+                    yamls = list(
+                        executor.map(
+                            lambda deployment: deployment.get_runtime_yamls(),
+                            deployments,
+                        )
+                    )
+            else:
+                yamls = [deployments[0].get_runtime_yamls()]
             return [
-                (
-                    deployment.dns_name,
-                    deployment.get_runtime_yamls(),
-                )
-                for deployment in deployments
+                (deployment.dns_name, deployment_yamls)
+                for deployment, deployment_yamls in zip(deployments, yamls)
             ]
@@ -1,20 +1,36 @@
+import functools
 import json
 from argparse import Namespace
 from typing import Dict, Optional, Tuple, Union, List
 
-from .....hubble.helper import parse_hub_uri
-from .....hubble.hubio import HubIO
 from ....networking import K8sGrpcConnectionPool
 from . import kubernetes_tools
 
 
+_DNS_NAME_TRANSLATION = str.maketrans('/_', '--')
+
+_CLI_SKIP_ATTRIBUTES = frozenset(
+    (
+        'uses',  # set manually
+        'uses_with',  # set manually
+        'runtime_cls',  # set manually
+        'workspace',
+        'log_config',
+        'polling_type',
+        'uses_after',
+        'uses_before',
+        'replicas',
+    )
+)
+
+
 def to_dns_name(name: str) -> str:
     """Converts the pod name to a dns compatible name.
 
     :param name: name of the pod
     :return: dns compatible name
     """
-    return name.replace('/', '-').replace('_', '-').lower()
+    return name.translate(_DNS_NAME_TRANSLATION).lower()
 
 
 def get_deployment_yamls(
@@ -22,7 +38,7 @@ def get_deployment_yamls(
     namespace: str,
     image_name: str,
     container_cmd: str,
-    container_args: str,
+    container_args: Union[str, List[str]],
     replicas: int,
     pull_policy: str,
     jina_pod_name: str,
@@ -35,8 +51,8 @@ def get_deployment_yamls(
     image_name_uses_after: Optional[str] = None,
     container_cmd_uses_before: Optional[str] = None,
     container_cmd_uses_after: Optional[str] = None,
-    container_args_uses_before: Optional[str] = None,
-    container_args_uses_after: Optional[str] = None,
+    container_args_uses_before: Optional[Union[str, List[str]]] = None,
+    container_args_uses_after: Optional[Union[str, List[str]]] = None,
 ) -> List[Dict]:
     """Get the yaml description of a service on Kubernetes
 
@@ -157,50 +173,42 @@ def get_cli_params(
     :return: string which contains all cli parameters
     """
     arguments.host = '0.0.0.0'
-    skip_attributes = [
-        'uses',  # set manually
-        'uses_with',  # set manually
-        'runtime_cls',  # set manually
-        'workspace',
-        'log_config',
-        'polling_type',
-        'uses_after',
-        'uses_before',
-        'replicas',
-    ] + list(skip_list)
+    skip_attributes = _CLI_SKIP_ATTRIBUTES.union(skip_list)
     if port_in:
         arguments.port_in = port_in
-    arg_list = [
-        [attribute, attribute.replace('_', '-'), value]
-        for attribute, value in arguments.__dict__.items()
-    ]
     cli_args = []
-    for attribute, cli_attribute, value in arg_list:
+    for attribute, value in arguments.__dict__.items():
         # TODO: This should not be here, its a workaround for our parser design with boolean values
         if attribute == 'k8s_connection_pool' and not value:
             cli_args.append(f'"--k8s-disable-connection-pool"')
         if attribute in skip_attributes:
             continue
+        cli_attribute = attribute.replace('_', '-')
         if type(value) == bool and value:
-            cli_args.append(f'"--{cli_attribute}"')
+            cli_args.append('"--' + cli_attribute + '"')
         elif type(value) != bool:
             if value is not None:
-                value = str(value)
-                value = value.replace('\'', '').replace('"', '\\"')
-                cli_args.append(f'"--{cli_attribute}", "{value}"')
+                value = str(value).replace('\'', '').replace('"', '\\"')
+                cli_args.append('"--' + cli_attribute + '", "' + value + '"')
 
-    cli_string = ', '.join(cli_args)
-    return cli_string
+    return ', '.join(cli_args)
 
 
+@functools.lru_cache(maxsize=None)
 def get_image_name(uses: str) -> str:
     """The image can be provided in different formats by the user.
     This function converts it to an image name which can be understood by k8s.
     It uses the Hub api to get the image name and the latest tag on Docker Hub.
+
+    The result is cached per `uses` string, so repeated shards/replicas of the
+    same Executor resolve the image through the Hub api only once per process.
     :param uses: image name
 
     :return: normalized image name
     """
+    from .....hubble.helper import parse_hub_uri
+    from .....hubble.hubio import HubIO
+
     try:
         scheme, name, tag, secret = parse_hub_uri(uses)
         meta_data, _ = HubIO.fetch_meta(name, tag, secret=secret, force=True)
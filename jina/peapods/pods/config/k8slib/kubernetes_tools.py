@@ -1,3 +1,5 @@
+import copy
+import functools
 import os
 from typing import Dict, Optional
 
@@ -8,6 +10,13 @@ DEPLOYMENT_FILES = [
     'deployment-uses-before-after',
 ]
 
+# templates where the parameters only fill string fields, those can be
+# filled directly on the parsed dictionary without a yaml round-trip
+NAMESPACE_ONLY_FILES = [
+    'connection-pool-role',
+    'connection-pool-role-binding',
+]
+
 cur_dir = os.path.dirname(__file__)
 DEFAULT_RESOURCE_DIR = os.path.join(
     cur_dir, '..', '..', '..', '..', 'resources', 'k8s', 'template'
@@ -24,6 +33,8 @@ def get_yaml(template: str, params: Dict) -> Dict:
 
     if template == 'configmap':
         yaml = _get_configmap_yaml(template, params)
+    elif template in NAMESPACE_ONLY_FILES:
+        yaml = _get_namespaced_yaml(template, params)
     elif template in DEPLOYMENT_FILES and params.get('device_plugins'):
         yaml = _get_yaml(template, params)
         yaml = _get_deployment_with_device_plugins(yaml, params)
@@ -33,26 +44,50 @@ def get_yaml(template: str, params: Dict) -> Dict:
     return yaml
 
 
-def _get_yaml(template: str, params: Dict) -> Dict:
-    import yaml
+@functools.lru_cache(maxsize=1)
+def _get_yaml_loader():
+    try:
+        # use the libyaml C extension when pyyaml is compiled with it,
+        # it parses roughly an order of magnitude faster
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    return SafeLoader
 
+
+@functools.lru_cache(maxsize=None)
+def _get_template_content(template: str) -> str:
     path = os.path.join(DEFAULT_RESOURCE_DIR, f'{template}.yml')
 
     with open(path) as f:
-        content = f.read()
-        for k, v in params.items():
-            content = content.replace(f'{{{k}}}', str(v))
-        d = yaml.safe_load(content)
-    return d
+        return f.read()
 
 
-def _get_configmap_yaml(template: str, params: Dict):
+@functools.lru_cache(maxsize=None)
+def _get_parsed_template(template: str) -> Dict:
     import yaml
 
-    path = os.path.join(DEFAULT_RESOURCE_DIR, f'{template}.yml')
+    return yaml.load(_get_template_content(template), Loader=_get_yaml_loader())
 
-    with open(path) as f:
-        config_map = yaml.safe_load(f)
+
+def _get_namespaced_yaml(template: str, params: Dict) -> Dict:
+    resource = copy.deepcopy(_get_parsed_template(template))
+    resource['metadata']['namespace'] = params.get('namespace')
+    return resource
+
+
+def _get_yaml(template: str, params: Dict) -> Dict:
+    import yaml
+
+    content = _get_template_content(template)
+    for k, v in params.items():
+        content = content.replace(f'{{{k}}}', str(v))
+    return yaml.load(content, Loader=_get_yaml_loader())
+
+
+def _get_configmap_yaml(template: str, params: Dict):
+    config_map = copy.deepcopy(_get_parsed_template(template))
 
     config_map['metadata']['name'] = params.get('name') + '-' + 'configmap'
     config_map['metadata']['namespace'] = params.get('namespace')
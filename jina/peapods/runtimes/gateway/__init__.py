@@ -1,3 +1,4 @@
+import functools
 from abc import ABC
 
 from .graph.topology_graph import TopologyGraph
@@ -6,6 +7,13 @@ from ...networking import create_connection_pool
 from ..asyncio import AsyncNewLoopRuntime
 
 
+@functools.lru_cache(maxsize=16)
+def _build_topology_graph(graph_description: str) -> TopologyGraph:
+    import json
+
+    return TopologyGraph(json.loads(graph_description))
+
+
 class GatewayRuntime(AsyncNewLoopRuntime, ABC):
     """
     The Runtime from which the GatewayRuntimes need to inherit
@@ -13,10 +21,9 @@ class GatewayRuntime(AsyncNewLoopRuntime, ABC):
 
     def _set_topology_graph(self):
         # check if it should be in K8s, maybe ConnectionPoolFactory to be created
-        import json
-
-        graph_description = json.loads(self.args.graph_description)
-        self._topology_graph = TopologyGraph(graph_description)
+        # the base graph is never mutated (requests work on per-request
+        # copies), so identical descriptions can share one parsed instance
+        self._topology_graph = _build_topology_graph(self.args.graph_description)
 
     def _set_connection_pool(self):
         import json
@@ -1,12 +1,15 @@
 import asyncio
+import itertools
+import time
 
-from collections import defaultdict
-from datetime import datetime
-from typing import List, Optional, Dict, Tuple
+from collections import Counter
+from typing import Awaitable, List, Optional, Dict, Tuple
 
 from ....networking import GrpcConnectionPool
 from .....types.request.data import DataRequest
 
+_GATEWAY_NODE_NAMES = frozenset({'start-gateway', 'end-gateway'})
+
 
 class TopologyGraph:
     """
@@ -24,6 +27,8 @@ class TopologyGraph:
             self.outgoing_nodes = []
             self.number_of_parts = number_of_parts
             self.hanging = hanging
+            self.predecessor_names = []
+            self.critical_path_length = 1
             self.parts_to_send = []
             self.start_time = None
             self.end_time = None
@@ -36,38 +41,50 @@ class TopologyGraph:
         async def _wait_previous_and_send(
             self,
             request: DataRequest,
-            previous_task: Optional[asyncio.Task],
+            previous_task: Optional[Awaitable],
             connection_pool: GrpcConnectionPool,
             endpoint: Optional[str],
         ):
             metadata = {}
             if previous_task is not None:
-                result = await previous_task
+                if isinstance(previous_task, asyncio.Future) and previous_task.done():
+                    # shared result is already there, no need to yield control
+                    result = previous_task.result()
+                else:
+                    result = await previous_task
                 request, metadata = result[0], result[1]
             if 'is-error' in metadata:
                 return request, metadata
             elif request is not None:
-                self.parts_to_send.append(request)
-                # this is a specific needs
-                if len(self.parts_to_send) == self.number_of_parts:
-                    self.start_time = datetime.utcnow()
-                    resp, metadata = await connection_pool.send_requests_once(
-                        requests=self.parts_to_send,
-                        pod=self.name,
-                        head=True,
-                        endpoint=endpoint,
-                    )
-                    self.end_time = datetime.utcnow()
-                    if 'is-error' in metadata:
-                        self.status = resp.header.status
-                    return resp, metadata
+                if self.number_of_parts == 1:
+                    # the common case, no need to accumulate anything
+                    requests_to_send = [request]
+                else:
+                    self.parts_to_send.append(request)
+                    # this is a specific needs
+                    if len(self.parts_to_send) < self.number_of_parts:
+                        return None, {}
+                    requests_to_send = self.parts_to_send
+                # grab a cheap epoch-ns int here, the conversion to a
+                # protobuf timestamp is deferred to `add_route`
+                self.start_time = time.time_ns()
+                resp, metadata = await connection_pool.send_requests_once(
+                    requests=requests_to_send,
+                    pod=self.name,
+                    head=True,
+                    endpoint=endpoint,
+                )
+                self.end_time = time.time_ns()
+                if 'is-error' in metadata:
+                    self.status = resp.header.status
+                return resp, metadata
             return None, {}
 
         def get_leaf_tasks(
             self,
             connection_pool: GrpcConnectionPool,
             request_to_send: Optional[DataRequest],
-            previous_task: Optional[asyncio.Task],
+            previous_task: Optional[Awaitable],
             endpoint: Optional[str] = None,
         ) -> List[Tuple[bool, asyncio.Task]]:
             """
@@ -100,25 +117,35 @@ class TopologyGraph:
                 These tasks will be based on awaiting for the task from previous_node and sending a request to the corresponding node. The other member of the pair
                 is a flag indicating if the task is to be awaited by the gateway or not.
             """
-            wait_previous_and_send_task = asyncio.create_task(
-                self._wait_previous_and_send(
-                    request_to_send, previous_task, connection_pool, endpoint=endpoint
-                )
-            )
-            if self.leaf:  # I am like a leaf
-                return [
-                    (not self.hanging, wait_previous_and_send_task)
-                ]  # I am the last in the chain
             hanging_tasks_tuples = []
-            for outgoing_node in self.outgoing_nodes:
-                t = outgoing_node.get_leaf_tasks(
+            # iterative depth-first traversal, the explicit stack replaces the
+            # recursive calls; children are pushed in reverse so the leaf tasks
+            # keep the same order the recursion produced
+            stack = [(self, request_to_send, previous_task)]
+            while stack:
+                node, request, node_previous_task = stack.pop()
+                wait_previous_and_send = node._wait_previous_and_send(
+                    request,
+                    node_previous_task,
                     connection_pool,
-                    None,
-                    wait_previous_and_send_task,
                     endpoint=endpoint,
                 )
-                # We are interested in the last one, that will be the task that awaits all the previous
-                hanging_tasks_tuples.extend(t)
+                if node.leaf:  # it is like a leaf, the last in the chain
+                    # leafs need to be real tasks, the hanging ones are fired
+                    # but never awaited by the gateway
+                    hanging_tasks_tuples.append(
+                        (not node.hanging, asyncio.create_task(wait_previous_and_send))
+                    )
+                elif len(node.outgoing_nodes) == 1:
+                    # a single consumer can await the bare coroutine, no need
+                    # to schedule an extra task for it
+                    stack.append((node.outgoing_nodes[0], None, wait_previous_and_send))
+                else:
+                    # several children await the same result, wrap it in a
+                    # task so it can be awaited more than once
+                    shared_task = asyncio.create_task(wait_previous_and_send)
+                    for outgoing_node in reversed(node.outgoing_nodes):
+                        stack.append((outgoing_node, None, shared_task))
 
             return hanging_tasks_tuples
 
@@ -130,27 +157,47 @@ class TopologyGraph:
             :return: modified request with added routes
             """
 
-            def _find_route(request):
-                for r in request.routes:
-                    if r.pod == self.name:
-                        return r
-                return None
-
-            r = _find_route(request)
-            if r is None and self.start_time:
-                r = request.routes.add()
-                r.pod = self.name
-                r.start_time.FromDatetime(self.start_time)
-                if self.end_time:
-                    r.end_time.FromDatetime(self.end_time)
-                if self.status:
-                    r.status.CopyFrom(self.status)
-            for outgoing_node in self.outgoing_nodes:
-                request = outgoing_node.add_route(request=request)
+            # index the already present routes once instead of scanning the
+            # routes list for every node
+            routed_pods = {r.pod for r in request.routes}
+
+            # iterate once over the nodes reachable from here, a merge node
+            # with several predecessors is only looked at a single time
+            visited = set()
+            to_visit = [self]
+            while to_visit:
+                node = to_visit.pop()
+                if node.name in visited:
+                    continue
+                visited.add(node.name)
+                if node.name not in routed_pods and node.start_time:
+                    routed_pods.add(node.name)
+                    r = request.routes.add()
+                    r.pod = node.name
+                    # truncate to microseconds, the JSON form of the routes
+                    # promises at most 6 fractional digits
+                    r.start_time.FromMicroseconds(node.start_time // 1000)
+                    if node.end_time:
+                        r.end_time.FromMicroseconds(node.end_time // 1000)
+                    if node.status:
+                        r.status.CopyFrom(node.status)
+                to_visit.extend(node.outgoing_nodes)
             return request
 
     def __init__(self, graph_representation: Dict, *args, **kwargs):
-        num_parts_per_node = defaultdict(int)
+        # trivial topology, nothing to schedule
+        if not any(
+            node_name not in _GATEWAY_NODE_NAMES
+            for node_name in itertools.chain(
+                graph_representation, *graph_representation.values()
+            )
+        ):
+            self._origin_nodes = []
+            self._nodes = ()
+            self._node_index = {}
+            return
+
+        num_parts_per_node = Counter()
         if 'start-gateway' in graph_representation:
             origin_node_names = graph_representation['start-gateway']
         else:
@@ -158,12 +205,12 @@ class TopologyGraph:
         hanging_pod_names = set()
         node_set = set()
         for node_name, outgoing_node_names in graph_representation.items():
-            if node_name not in {'start-gateway', 'end-gateway'}:
+            if node_name not in _GATEWAY_NODE_NAMES:
                 node_set.add(node_name)
             if len(outgoing_node_names) == 0:
                 hanging_pod_names.add(node_name)
             for out_node_name in outgoing_node_names:
-                if out_node_name not in {'start-gateway', 'end-gateway'}:
+                if out_node_name not in _GATEWAY_NODE_NAMES:
                     node_set.add(out_node_name)
                     num_parts_per_node[out_node_name] += 1
 
@@ -171,19 +218,94 @@ class TopologyGraph:
         for node_name in node_set:
             nodes[node_name] = self._ReqReplyNode(
                 name=node_name,
-                number_of_parts=num_parts_per_node[node_name]
-                if num_parts_per_node[node_name] > 0
-                else 1,
+                # a missing entry counts as 0, nodes fed by the gateway only
+                # still expect a single part
+                number_of_parts=num_parts_per_node[node_name] or 1,
                 hanging=node_name in hanging_pod_names,
             )
 
         for node_name, outgoing_node_names in graph_representation.items():
-            if node_name not in ['start-gateway', 'end-gateway']:
+            if node_name not in _GATEWAY_NODE_NAMES:
                 for out_node_name in outgoing_node_names:
-                    if out_node_name not in ['start-gateway', 'end-gateway']:
+                    if out_node_name not in _GATEWAY_NODE_NAMES:
                         nodes[node_name].outgoing_nodes.append(nodes[out_node_name])
+                        nodes[out_node_name].predecessor_names.append(node_name)
+
+        # freeze the graph data after wiring, requests only ever read it
+        for node in nodes.values():
+            node.outgoing_nodes = tuple(node.outgoing_nodes)
+            node.predecessor_names = tuple(node.predecessor_names)
+
+        # the critical path length (longest chain below each node) is static,
+        # compute it once here so dispatch can start the longest chains first
+        critical_path_lengths = {}
+
+        def _critical_path_length(node):
+            if node.name not in critical_path_lengths:
+                critical_path_lengths[node.name] = 1 + max(
+                    (
+                        _critical_path_length(outgoing_node)
+                        for outgoing_node in node.outgoing_nodes
+                    ),
+                    default=0,
+                )
+            return critical_path_lengths[node.name]
 
-        self._origin_nodes = [nodes[node_name] for node_name in origin_node_names]
+        for node in nodes.values():
+            node.critical_path_length = _critical_path_length(node)
+
+        # stable sort, origins with equally long chains keep their given order
+        self._origin_nodes = sorted(
+            (nodes[node_name] for node_name in origin_node_names),
+            key=lambda node: node.critical_path_length,
+            reverse=True,
+        )
+
+        # flatten the graph into an indexed schedule: nodes in topological
+        # order plus the predecessor indices of each node, so consumers can
+        # work with plain integers instead of chasing object references
+        in_degree = {name: len(nodes[name].predecessor_names) for name in nodes}
+        ready = [name for name, degree in in_degree.items() if degree == 0]
+        topo_order = []
+        while ready:
+            name = ready.pop()
+            topo_order.append(name)
+            for outgoing_node in nodes[name].outgoing_nodes:
+                in_degree[outgoing_node.name] -= 1
+                if in_degree[outgoing_node.name] == 0:
+                    ready.append(outgoing_node.name)
+        self._nodes = tuple(nodes[name] for name in topo_order)
+        self._node_index = {name: i for i, name in enumerate(topo_order)}
+
+    def __deepcopy__(self, memo):
+        # the gateway copies the graph per request so that parts_to_send and
+        # the timing fields are never shared between in-flight requests. The
+        # structure itself is immutable, so rebuild the nodes with fresh state
+        # over the flat indexed schedule instead of running the generic
+        # deepcopy machinery over every field
+        copied = TopologyGraph.__new__(TopologyGraph)
+        new_nodes = []
+        for node in self._nodes:
+            new_node = self._ReqReplyNode(
+                name=node.name,
+                number_of_parts=node.number_of_parts,
+                hanging=node.hanging,
+            )
+            new_node.predecessor_names = node.predecessor_names
+            new_node.critical_path_length = node.critical_path_length
+            new_nodes.append(new_node)
+        node_index = self._node_index
+        for i, node in enumerate(self._nodes):
+            new_nodes[i].outgoing_nodes = tuple(
+                new_nodes[node_index[outgoing_node.name]]
+                for outgoing_node in node.outgoing_nodes
+            )
+        copied._nodes = tuple(new_nodes)
+        copied._node_index = node_index
+        copied._origin_nodes = [
+            new_nodes[node_index[node.name]] for node in self._origin_nodes
+        ]
+        return copied
 
     def add_routes(self, request: 'DataRequest'):
         """
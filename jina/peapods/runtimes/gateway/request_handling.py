@@ -57,13 +57,23 @@ def handle_request(
             tasks: List[asyncio.Task], request_graph: TopologyGraph
         ) -> asyncio.Future:
 
-            partial_responses = await asyncio.gather(*tasks)
-            partial_responses, metadatas = zip(*partial_responses)
-            filtered_partial_responses = list(
-                filter(lambda x: x is not None, partial_responses)
-            )
-
-            response = filtered_partial_responses[0]
+            # plain gather so the first failing branch surfaces immediately
+            # instead of waiting for every sibling to finish
+            partial_responses, metadatas = zip(*(await asyncio.gather(*tasks)))
+
+            # prefer the first errored partial response so the failure
+            # surfaces to the client instead of an arbitrary sibling branch
+            response = None
+            for partial_response, metadata in zip(partial_responses, metadatas):
+                if partial_response is not None and 'is-error' in metadata:
+                    response = partial_response
+                    break
+            if response is None:
+                response = next(
+                    partial_response
+                    for partial_response in partial_responses
+                    if partial_response is not None
+                )
             request_graph.add_routes(response)
 
             return response
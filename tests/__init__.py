@@ -1,3 +1,4 @@
+import functools
 import os
 import sys
 from typing import Iterator, TYPE_CHECKING
@@ -59,6 +60,28 @@ def random_docs(
         yield d
 
 
+@functools.lru_cache(maxsize=None)
+def _doc_template(text: str) -> bytes:
+    from jina import Document
+
+    return Document(text=text).to_bytes()
+
+
+def make_doc(text: str) -> 'Document':
+    """Build a Document with the given text from a cached serialized template.
+
+    Deserializing the template skips the id minting and protobuf field
+    defaulting of a fresh construction, which adds up in tightly parametrized
+    tests. Documents made from the same text share their id.
+
+    :param text: the text of the Document
+    :return: a Document carrying ``text``
+    """
+    from jina import Document
+
+    return Document(_doc_template(text))
+
+
 def validate_callback(mock, validate_func):
     for args, kwargs in mock.call_args_list:
         validate_func(*args, **kwargs)
@@ -3,15 +3,74 @@ import os
 import pathlib
 import random
 import shutil
+import socket
 import string
+import sys
 import tempfile
 import time
+from collections import deque
 
 import pytest
 from fastapi.testclient import TestClient
 
 from jina import helper
 
+if sys.platform != 'win32':
+    try:
+        import uvloop
+
+        # the runtimes install this policy themselves, setting it here makes
+        # the loops driven by the tests (clients, pytest-asyncio) use the
+        # faster C event loop as well
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ModuleNotFoundError:
+        pass
+
+
+def _prefetch_free_ports(num_ports=256):
+    """Probe the OS once for a batch of distinct free ports. The probe
+    sockets are all closed before returning: peas are started with the
+    ``fork`` method and would inherit any socket still bound here, keeping
+    the port occupied inside every child. Availability is re-checked at
+    hand-out instead."""
+    sockets = []
+    ports = deque()
+    try:
+        for _ in range(num_ports):
+            s = socket.socket()
+            s.bind(('', 0))
+            sockets.append(s)
+    except OSError:
+        pass
+    for s in sockets:
+        ports.append(s.getsockname()[1])
+        s.close()
+    return ports
+
+
+_port_pool = _prefetch_free_ports()
+_os_random_port = helper.random_port
+
+
+def _pooled_random_port():
+    while _port_pool:
+        port = _port_pool.popleft()
+        # the port was free at prefetch time, skip it if something else on
+        # the host has claimed it in the meantime
+        try:
+            with socket.socket() as s:
+                s.bind(('', port))
+            return port
+        except OSError:
+            continue
+    return _os_random_port()
+
+
+# every pod of every Flow built in the tests asks the kernel for an ephemeral
+# port; serving them from the pre-fetched pool removes the per-call
+# bind/getsockname/close round-trip
+helper.random_port = _pooled_random_port
+
 
 @pytest.fixture(scope='function')
 def random_workspace_name():
@@ -145,8 +145,9 @@ def test_flow_returned_collect(protocol):
         num_evaluations = 0
         scores = set()
         for doc in resp.data.docs:
-            num_evaluations += len(NamedScoreMap(doc.evaluations))
-            scores.add(NamedScoreMap(doc.evaluations)['evaluate'].value)
+            evaluations = NamedScoreMap(doc.evaluations)
+            num_evaluations += len(evaluations)
+            scores.add(evaluations['evaluate'].value)
         assert num_evaluations == 1
         assert 10.0 in scores
 
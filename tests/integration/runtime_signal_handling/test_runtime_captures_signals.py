@@ -1,6 +1,7 @@
 import multiprocessing
 import os
 import signal
+import socket
 import time
 
 import pytest
@@ -29,19 +30,30 @@ class DummyExecutor(Executor):
             fp.write(f'proper close;{self.request_count}')
 
 
+def _wait_ready(host, port, timeout=2.0):
+    # poll until the server accepts connections instead of sleeping a fixed
+    # amount of time
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.05):
+                return
+        except OSError:
+            time.sleep(0.01)
+    raise TimeoutError(f'server on {host}:{port} not ready after {timeout}s')
+
+
+# the payload never changes, build it once instead of constructing 10
+# Documents for every message
+_TEST_DOCS = DocumentArray([Document(text='input document') for _ in range(10)])
+
+
 def _create_test_data_message():
-    req = list(
-        request_generator(
-            '/', DocumentArray([Document(text='input document') for _ in range(10)])
-        )
-    )[0]
-    return req
+    return list(request_generator('/', _TEST_DOCS))[0]
 
 
 @pytest.mark.parametrize('signal', [signal.SIGTERM, signal.SIGINT])
 def test_executor_runtimes(signal, tmpdir):
-    import time
-
     args = set_pea_parser().parse_args([])
 
     def run(args):
@@ -55,14 +67,14 @@ def test_executor_runtimes(signal, tmpdir):
 
     process = multiprocessing.Process(target=run, args=(args,))
     process.start()
-    time.sleep(0.5)
+    _wait_ready(args.host, args.port_in)
 
+    # send_request_sync only returns once the executor has processed the
+    # request, no extra wait is needed before sending the signal
     GrpcConnectionPool.send_request_sync(
         _create_test_data_message(), target=f'{args.host}:{args.port_in}'
     )
 
-    time.sleep(0.1)
-
     os.kill(process.pid, signal)
     process.join()
     with open(f'{tmpdir}/test.txt', 'r') as fp:
@@ -72,26 +84,34 @@ def test_executor_runtimes(signal, tmpdir):
     assert split[1] == '1'
 
 
-@pytest.mark.parametrize('signal', [signal.SIGTERM, signal.SIGINT])
-@pytest.mark.parametrize('protocol', ['grpc', 'http', 'websocket'])
-def test_gateway(signal, protocol):
-    import time
-
-    def run():
-        args = set_gateway_parser().parse_args(
-            [
-                '--protocol',
-                protocol,
-                '--graph-description',
-                '{}',
-                '--pods-addresses',
-                '{}',
-            ]
-        )
-        gateway(args)
-
-    process = multiprocessing.Process(target=run)
+# gateway processes are spawned from a forkserver with `jina` preloaded, so
+# every process after the first skips the interpreter startup and import cost
+_forkserver_ctx = multiprocessing.get_context('forkserver')
+_forkserver_ctx.set_forkserver_preload(['jina'])
+
+
+@pytest.fixture(params=['grpc', 'http', 'websocket'])
+def gateway_process(request):
+    args = set_gateway_parser().parse_args(
+        [
+            '--protocol',
+            request.param,
+            '--graph-description',
+            '{}',
+            '--pods-addresses',
+            '{}',
+        ]
+    )
+    process = _forkserver_ctx.Process(target=gateway, args=(args,))
     process.start()
-    time.sleep(0.5)
-    os.kill(process.pid, signal)
+    _wait_ready(args.host, args.port_expose)
+    yield process
+    if process.is_alive():
+        process.terminate()
     process.join()
+
+
+@pytest.mark.parametrize('signal', [signal.SIGTERM, signal.SIGINT])
+def test_gateway(signal, gateway_process):
+    os.kill(gateway_process.pid, signal)
+    gateway_process.join()
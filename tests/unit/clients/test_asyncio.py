@@ -13,9 +13,10 @@ REQUEST_SIZE = 10
 @pytest.mark.asyncio
 async def test_asyncio_req_generator():
     async def input_function():
-        data = [Document() for _ in range(NUM_INPUT_DOCS)]
-        for doc in data:
-            yield doc
+        # stream the Documents as they are built instead of materializing
+        # the whole list up front
+        for _ in range(NUM_INPUT_DOCS):
+            yield Document()
 
     generator = request_generator('/', input_function(), request_size=REQUEST_SIZE)
     i = 0
@@ -0,0 +1,61 @@
+import pytest
+
+from jina.clients.mixin import PostMixin
+from jina.types.request.data import DataRequest
+
+
+class _CannedClient:
+    """Replays prepared responses so `post` can be exercised without a Flow."""
+
+    def __init__(self, responses):
+        self._responses = responses
+        self.show_progress = False
+        self.continue_on_error = False
+        self.kwargs = None
+
+    async def _get_results(self, **kwargs):
+        self.kwargs = kwargs
+        for r in self._responses:
+            yield r
+
+
+class _CannedFlow(PostMixin):
+    def __init__(self, responses):
+        self._client = _CannedClient(responses)
+
+    @property
+    def client(self):
+        return self._client
+
+
+@pytest.mark.parametrize('return_results', [True, False])
+@pytest.mark.parametrize('with_on_done', [True, False])
+@pytest.mark.parametrize('with_on_error', [True, False])
+@pytest.mark.parametrize('with_on_always', [True, False])
+def test_post_return_results(
+    return_results, with_on_done, with_on_error, with_on_always, mocker
+):
+    responses = [DataRequest() for _ in range(3)]
+    f = _CannedFlow(responses)
+    on_done = mocker.Mock() if with_on_done else None
+    on_error = mocker.Mock() if with_on_error else None
+    on_always = mocker.Mock() if with_on_always else None
+
+    r = f.post(
+        '/',
+        on_done=on_done,
+        on_error=on_error,
+        on_always=on_always,
+        return_results=return_results,
+    )
+
+    if return_results:
+        assert r == responses
+    else:
+        assert r is None
+
+    # the callbacks are not resolved in the mixin, they must reach the client untouched
+    assert f.client.kwargs['on_done'] is on_done
+    assert f.client.kwargs['on_error'] is on_error
+    assert f.client.kwargs['on_always'] is on_always
+    assert f.client.kwargs['exec_endpoint'] == '/'
@@ -37,14 +37,10 @@ def namespace_equal(
 
 @pytest.mark.parametrize('is_master', (True, False))
 def test_version(is_master, requests_mock):
-    if is_master:
-        version = 'v2'
-    else:
-        # current version is published already
-        version = __version__
-    requests_mock.get(
-        'https://registry.hub.docker.com/v1/repositories/jinaai/jina/tags',
-        text='[{"name": "v1"}, {"name": "' + version + '"}]',
+    _get_base_executor_version.cache_clear()
+    requests_mock.head(
+        f'https://registry.hub.docker.com/v2/jinaai/jina/manifests/{__version__}',
+        status_code=404 if is_master else 200,
     )
     v = _get_base_executor_version()
     if is_master:
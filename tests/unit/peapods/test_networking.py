@@ -370,9 +370,10 @@ async def test_secure_send_request(private_key_cert_chain):
     server_process1.join()
 
 
+# the payload never changes, build it once instead of constructing 10
+# Documents for every message
+_TEST_DOCS = DocumentArray([Document(text='input document') for _ in range(10)])
+
+
 def _create_test_data_message():
-    return list(
-        request_generator(
-            '/', DocumentArray([Document(text='input document') for _ in range(10)])
-        )
-    )[0]
+    return list(request_generator('/', _TEST_DOCS))[0]